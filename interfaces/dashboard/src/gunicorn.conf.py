@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the XMRT Dashboard
+
+Usage: gunicorn -c gunicorn.conf.py main:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# gevent workers let the blocking upstream and Redis calls yield while
+# waiting on sockets instead of pinning a worker per request
+worker_class = 'gevent'
+workers = int(os.environ.get('GUNICORN_WORKERS', 4))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+
+def post_worker_init(worker):
+    # Every worker runs a refresher; a Redis lock lets only one refresh at a time
+    from main import start_snapshot_refresher
+    start_snapshot_refresher()
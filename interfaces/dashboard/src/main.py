@@ -2,17 +2,51 @@
 """
 XMRT Dashboard - Administrative Interface
 Flask application for monitoring and managing the XMRT ecosystem
+
+Production: gunicorn -c gunicorn.conf.py main:app
+Agent workers: rq worker agents (run from this directory)
 """
 
+# Patch blocking sockets before anything else imports them so requests and
+# redis-py yield cooperatively under gevent workers
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
 import os
-import json
 import logging
-from datetime import datetime, timedelta
-from flask import Flask, render_template, jsonify, request, redirect, url_for
+import time
+import uuid
+import socket
+import hashlib
+import functools
+import threading
+import queue
+import concurrent.futures
+from datetime import datetime, timedelta, timezone
+from flask import Flask, render_template, jsonify, request, redirect, url_for, g, has_request_context
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
+import fastjsonschema
+import msgpack
+import orjson
+import pybreaker
+import rq
+from rq.exceptions import NoSuchJobError
+from rq.job import Job, JobStatus
 import redis
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from types import MappingProxyType
 from typing import Dict, List, Any
+from urllib.parse import urlsplit
+
+from tasks import create_agent
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,22 +56,190 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
+# Templates are only re-checked for changes in development, and compiled
+# templates are cached on disk so restarted workers skip recompilation
+app.config['TEMPLATES_AUTO_RELOAD'] = os.environ.get('FLASK_ENV') == 'development'
+app.jinja_options = {
+    **app.jinja_options,
+    'bytecode_cache': FileSystemBytecodeCache(os.environ.get('JINJA_CACHE_DIR'))
+}
+
+# Naive datetimes are UTC throughout (datetime.utcnow)
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, with native datetime support"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+app.json = OrjsonProvider(app)
+
+# Compress responses of 500 bytes or more, preferring brotli over gzip
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
 # Enable CORS for all routes
 CORS(app, origins=['*'])
 
-# Redis connection for caching and real-time data
+# Redis connection pools for caching and real-time data; concurrent handlers
+# each get their own connection and idle ones are health-checked before reuse.
+# When all connections are busy, callers wait up to 'timeout' seconds for one
+# instead of failing, since gevent workers run far more greenlets than that.
+REDIS_OPTIONS = {
+    'host': os.environ.get('REDIS_HOST', 'localhost'),
+    'port': int(os.environ.get('REDIS_PORT', 6379)),
+    'db': 0,
+    'max_connections': 50,
+    'timeout': 1,
+    'socket_timeout': 0.5,
+    'socket_connect_timeout': 0.5,
+    'health_check_interval': 30
+}
+redis_pool = redis.BlockingConnectionPool(decode_responses=True, **REDIS_OPTIONS)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Binary handle for msgpack-encoded cache payloads
+cache_pool = redis.BlockingConnectionPool(decode_responses=False, **REDIS_OPTIONS)
+cache_client = redis.Redis(connection_pool=cache_pool)
+
+# Agent creation runs on RQ workers; RQ needs the binary (non-decoding) handle
+agent_queue = rq.Queue('agents', connection=cache_client)
 try:
-    redis_client = redis.Redis(
-        host=os.environ.get('REDIS_HOST', 'localhost'),
-        port=int(os.environ.get('REDIS_PORT', 6379)),
-        db=0,
-        decode_responses=True
-    )
     redis_client.ping()
     logger.info("Redis connection established")
-except Exception as e:
+except redis.exceptions.RedisError as e:
+    # Keep the client: the pool reconnects once Redis becomes available
     logger.warning(f"Redis connection failed: {e}")
-    redis_client = None
+
+# Number of entries retained per log level
+LOG_RETENTION = 1000
+
+# Log records are buffered in memory and written to Redis in batches so that
+# logging never waits on Redis; records are dropped when the buffer is full
+LOG_BUFFER_SIZE = 10000
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 1
+
+class RedisLogHandler(logging.Handler):
+    """Logging handler that buffers records and flushes them in batches onto
+    capped per-level Redis lists from a background thread"""
+
+    def __init__(self, client: redis.Redis, component: str = 'dashboard'):
+        super().__init__()
+        self.client = client
+        self.component = component
+        self.buffer = queue.Queue(maxsize=LOG_BUFFER_SIZE)
+        self._flusher_pid = None
+        self._flusher_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            entry = orjson.dumps({
+                'timestamp': datetime.utcfromtimestamp(record.created),
+                'level': record.levelname,
+                'component': self.component,
+                'message': record.getMessage(),
+                'details': {'logger': record.name}
+            }, option=ORJSON_OPTIONS)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            self.buffer.put_nowait((record.levelname, entry))
+        except queue.Full:
+            pass  # Redis is falling behind; drop rather than block the caller
+        self._ensure_flusher()
+
+    def flush(self):
+        """Write all buffered records to Redis"""
+        while self._write_batch():
+            pass
+
+    def _ensure_flusher(self):
+        """Start the flusher thread in this process on first use"""
+        # Threads do not survive fork, so a forked worker starts its own flusher
+        pid = os.getpid()
+        if self._flusher_pid == pid:
+            return
+        with self._flusher_lock:
+            if self._flusher_pid != pid:
+                threading.Thread(target=self._flush_loop, name='redis-log-flusher', daemon=True).start()
+                self._flusher_pid = pid
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(LOG_FLUSH_INTERVAL)
+            self.flush()
+
+    def _write_batch(self) -> bool:
+        """Write up to LOG_BATCH_SIZE buffered records, returning whether any
+        were written; a failed write stops the caller draining the buffer"""
+        batch = []
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                batch.append(self.buffer.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return False
+
+        pipe = self.client.pipeline(transaction=False)
+        for level, entry in batch:
+            pipe.lpush(f"logs:{level}", entry)
+        for level in {level for level, _ in batch}:
+            pipe.ltrim(f"logs:{level}", 0, LOG_RETENTION - 1)
+        try:
+            pipe.execute()
+        except redis.exceptions.RedisError:
+            # Redis outages are reported by the status endpoint; the batch is dropped
+            return False
+        return True
+
+logger.addHandler(RedisLogHandler(redis_client))
+
+# Shared HTTP session so upstream probes reuse pooled keep-alive connections
+HTTP = requests.Session()
+HTTP.headers['Connection'] = 'keep-alive'
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=0)
+)
+HTTP.mount('http://', _http_adapter)
+HTTP.mount('https://', _http_adapter)
+
+# (connect, read) timeouts: dead hosts fail fast, slow but healthy ones still answer
+UPSTREAM_TIMEOUT = (0.5, 2.0)
+
+# Worker pool for fanning out blocking upstream calls
+EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+PROBE_WAIT_TIMEOUT = 3
+
+# A TCP connect is enough to tell a down host on the request path
+TCP_PROBE_TIMEOUT = 0.2
+
+# Circuit breakers per upstream: after 3 consecutive failures calls are
+# short-circuited (reported unreachable) for 30 seconds without touching the network
+agent_breaker = pybreaker.CircuitBreaker(fail_max=3, reset_timeout=30, name='agent-api')
+mesh_breaker = pybreaker.CircuitBreaker(fail_max=3, reset_timeout=30, name='mesh-api')
+rpc_breaker = pybreaker.CircuitBreaker(fail_max=3, reset_timeout=30, name='blockchain-rpc')
+
+# Redis is pinged for status at most this often (seconds)
+REDIS_HEALTH_INTERVAL = 10
+_redis_health = {'checked_at': None, 'connected': False}
+
+# Background dashboard snapshot; the lock elects one refresher across workers
+SNAPSHOT_KEY = 'dashboard:snapshot'
+SNAPSHOT_LOCK_KEY = 'dashboard:snapshot:lock'
+SNAPSHOT_INTERVAL = int(os.environ.get('SNAPSHOT_INTERVAL', 5))
+REFRESHER_ID = uuid.uuid4().hex
+_refresher_thread = None
 
 # Configuration
 CONFIG = {
@@ -45,24 +247,321 @@ CONFIG = {
     'AGENT_API_URL': os.environ.get('AGENT_API_URL', 'http://localhost:5001'),
     'MESH_API_URL': os.environ.get('MESH_API_URL', 'http://localhost:5002'),
     'TREASURY_CONTRACT': os.environ.get('TREASURY_CONTRACT', '0x...'),
-    'XMRT_TOKEN_CONTRACT': os.environ.get('XMRT_TOKEN_CONTRACT', '0x...')
+    'XMRT_TOKEN_CONTRACT': os.environ.get('XMRT_TOKEN_CONTRACT', '0x...'),
+    'USDC_TOKEN_CONTRACT': os.environ.get('USDC_TOKEN_CONTRACT', '0x...')
 }
 
+# Request schema for agent creation, compiled once at import
+validate_agent_config = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['name', 'type', 'config'],
+    'properties': {
+        'name': {'type': 'string', 'minLength': 1},
+        'type': {'type': 'string', 'minLength': 1},
+        'config': {'type': 'object'}
+    }
+})
+
+# ERC-20 balanceOf(address) selector and token decimals for treasury balances
+ERC20_BALANCE_OF = '0x70a08231'
+TREASURY_TOKENS = {
+    'xmrt_balance': ('XMRT_TOKEN_CONTRACT', 18),
+    'usdc_balance': ('USDC_TOKEN_CONTRACT', 6)
+}
+
+# Mock data until the orchestrator and blockchain integrations land. Rows are
+# (age, fields) pairs built once at import; timestamps are stamped per call.
+_MOCK_AGENTS = (
+    (timedelta(minutes=5), MappingProxyType({
+        'id': 'governance-agent-001',
+        'name': 'Governance Agent',
+        'type': 'governance',
+        'status': 'active',
+        'tasks_completed': 42,
+        'success_rate': 0.95
+    })),
+    (timedelta(minutes=2), MappingProxyType({
+        'id': 'treasury-agent-001',
+        'name': 'Treasury Agent',
+        'type': 'treasury',
+        'status': 'active',
+        'tasks_completed': 28,
+        'success_rate': 0.98
+    })),
+    (timedelta(hours=1), MappingProxyType({
+        'id': 'mining-coordinator-001',
+        'name': 'Mining Coordinator',
+        'type': 'mining',
+        'status': 'idle',
+        'tasks_completed': 156,
+        'success_rate': 0.92
+    }))
+)
+
+_MOCK_TREASURY_BALANCES = MappingProxyType({
+    'total_value_locked': 1250000.50,
+    'xmrt_balance': 850000.25,
+    'eth_balance': 125.75,
+    'usdc_balance': 275000.00
+})
+
+_MOCK_TREASURY_TRANSACTIONS = (
+    (timedelta(hours=2), MappingProxyType({
+        'hash': '0x1234...5678',
+        'type': 'reward_distribution',
+        'amount': 5000.00
+    })),
+    (timedelta(hours=6), MappingProxyType({
+        'hash': '0x9876...4321',
+        'type': 'fee_collection',
+        'amount': 125.50
+    }))
+)
+
+_MOCK_ACTIVITIES = (
+    (timedelta(minutes=5), MappingProxyType({
+        'type': 'agent_action',
+        'description': 'Governance Agent processed proposal #42',
+        'status': 'success'
+    })),
+    (timedelta(minutes=15), MappingProxyType({
+        'type': 'treasury_action',
+        'description': 'Reward distribution completed',
+        'status': 'success'
+    })),
+    (timedelta(hours=1), MappingProxyType({
+        'type': 'system_event',
+        'description': 'New mining cluster formed',
+        'status': 'info'
+    }))
+)
+
+_MOCK_WORKFLOWS = (
+    (timedelta(hours=2), MappingProxyType({
+        'id': 'proposal-processing',
+        'name': 'Proposal Processing Workflow',
+        'status': 'active',
+        'executions': 15,
+        'success_rate': 0.93
+    })),
+    (timedelta(days=1), MappingProxyType({
+        'id': 'reward-distribution',
+        'name': 'Reward Distribution Workflow',
+        'status': 'scheduled',
+        'executions': 8,
+        'success_rate': 1.0
+    }))
+)
+
+class UpstreamError(Exception):
+    """Raised when an upstream service needed by a helper is unavailable"""
+
+def cached(ttl: int, key: str, fallback: bool = False):
+    """Cache a helper's JSON-serializable result in Redis for ttl seconds
+
+    Each entry is stored twice: ``key:fresh`` expires after ttl while
+    ``key:last`` is kept indefinitely. With fallback enabled, a helper that
+    raises is answered from ``key:last`` and the result is flagged as stale.
+
+    The wrapped helper gains ``load()``, which returns ``(value, cache_status,
+    etag)`` without touching the request context.
+    """
+    fresh_key = f"{key}:fresh"
+    last_key = f"{key}:last"
+    meta_key = f"{key}:meta"
+
+    def decorator(func):
+        def load(*args, **kwargs):
+            try:
+                raw, etag = cache_client.pipeline().get(fresh_key).hget(meta_key, 'etag').execute()
+            except redis.exceptions.RedisError as e:
+                logger.warning(f"Cache read failed for {key}: {e}")
+                return func(*args, **kwargs), None, None
+            if raw is not None:
+                return _cache_loads(raw), 'HIT', etag.decode() if etag else None
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not fallback:
+                    raise
+                stale = _load_stale(last_key)
+                if stale is None:
+                    raise
+                logger.warning(f"Serving stale {key} after upstream failure: {e}")
+                return stale, 'STALE', None
+
+            now = datetime.utcnow()
+            payload = _cache_dumps(result)
+            etag = etag_for(payload)
+            try:
+                pipe = cache_client.pipeline()
+                pipe.setex(fresh_key, ttl, payload)
+                pipe.set(last_key, payload)
+                pipe.hset(meta_key, mapping={
+                    'etag': etag,
+                    'generated_at': now.isoformat(),
+                    'stale_at': (now + timedelta(seconds=ttl)).isoformat()
+                })
+                pipe.execute()
+            except redis.exceptions.RedisError as e:
+                logger.warning(f"Cache write failed for {key}: {e}")
+
+            return result, 'MISS', etag
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            value, cache_status, etag = load(*args, **kwargs)
+            if cache_status:
+                _set_cache_status(cache_status, etag)
+            return value
+
+        wrapper.cache_key = fresh_key
+        wrapper.load = load
+        return wrapper
+    return decorator
+
+def load_cached(*loaders) -> List[Any]:
+    """Load several cached helpers, fetching their entries in one Redis round trip"""
+    return [value for value, _ in load_cached_with_status(*loaders)]
+
+def load_cached_with_status(*loaders, return_exceptions: bool = False) -> List[Any]:
+    """Load several cached helpers as (value, cache_status) pairs
+    
+    Entries are fetched in one Redis round trip. Helpers whose entry is
+    missing are called instead: the first miss on this thread and the rest
+    concurrently on the executor. With return_exceptions, a helper that
+    raises yields ``(exception, 'ERROR')`` instead of propagating.
+    """
+    entries = [(None, None)] * len(loaders)
+    try:
+        pipe = cache_client.pipeline()
+        for loader in loaders:
+            pipe.get(loader.cache_key)
+        entries = [(None, None) if raw is None else (_cache_loads(raw), 'HIT') for raw in pipe.execute()]
+    except redis.exceptions.RedisError as e:
+        logger.warning(f"Cache pipeline read failed: {e}")
+    
+    misses = [i for i, (value, _) in enumerate(entries) if value is None]
+    futures = {i: EXECUTOR.submit(loaders[i].load) for i in misses[1:]}
+    if misses:
+        futures[misses[0]] = concurrent.futures.Future()
+        try:
+            futures[misses[0]].set_result(loaders[misses[0]].load())
+        except Exception as e:
+            futures[misses[0]].set_exception(e)
+    for i, future in futures.items():
+        try:
+            value, cache_status, _ = future.result()
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            value, cache_status = e, 'ERROR'
+        entries[i] = (value, cache_status)
+    
+    return entries
+
+def _cache_dumps(value: Any) -> bytes:
+    """Serialize a value for storage in the cache"""
+    return msgpack.packb(value, datetime=True, default=_msgpack_default)
+
+def _cache_loads(raw: bytes) -> Any:
+    """Deserialize a value stored in the cache"""
+    return msgpack.unpackb(raw, timestamp=3)
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode naive datetimes, which are UTC throughout, as msgpack timestamps"""
+    if isinstance(obj, datetime) and obj.tzinfo is None:
+        return obj.replace(tzinfo=timezone.utc)
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+def _load_stale(last_key: str) -> Any:
+    """Load the last known value for a cache entry, flagged as stale"""
+    try:
+        raw = cache_client.get(last_key)
+    except redis.exceptions.RedisError:
+        return None
+    if raw is None:
+        return None
+
+    value = _cache_loads(raw)
+    if isinstance(value, dict):
+        value['stale'] = True
+    return value
+
+def _set_cache_status(status: str, etag: str = None):
+    """Record the cache outcome and payload ETag so /api/* responses can expose them"""
+    if has_request_context():
+        g.cache_status = status
+        g.cache_etag = etag
+
+def etag_for(body: bytes) -> str:
+    """Compute the ETag for a serialized payload"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def etag_response(obj: Any):
+    """JSON response carrying an ETag, or 304 Not Modified if the client's copy matches
+    
+    Uses the ETag stored alongside the cached payload when the object came
+    from the cache, so unchanged polls skip serialization entirely.
+    """
+    etag = g.get('cache_etag')
+    body = None
+    if etag is None:
+        body = app.json.dumps(obj).encode()
+        etag = etag_for(body)
+    
+    matched = _matching_etag(etag)
+    if matched is not None:
+        response = app.response_class(status=304)
+        response.set_etag(matched)
+        return response
+    
+    if body is None:
+        body = app.json.dumps(obj).encode()
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+def _matching_etag(etag: str) -> Any:
+    """Return the client's validator matching etag, or None
+    
+    Flask-Compress suffixes the ETag of compressed responses with the
+    algorithm (``<etag>:gzip``), so clients echo those variants back.
+    """
+    candidates = [etag] + [f"{etag}:{algorithm}" for algorithm in app.config['COMPRESS_ALGORITHM']]
+    for candidate in candidates:
+        if request.if_none_match.contains(candidate):
+            return candidate
+    return None
+
+@app.after_request
+def add_cache_header(response):
+    """Expose cache hits and misses on API responses"""
+    cache_status = g.get('cache_status')
+    if cache_status and request.path.startswith('/api/'):
+        response.headers['X-Cache'] = cache_status
+    return response
+
 @app.route('/')
 def dashboard():
     """Main dashboard view"""
     try:
-        # Get system status
-        system_status = get_system_status()
-        
-        # Get agent information
-        agents = get_active_agents()
-        
-        # Get treasury data
-        treasury_data = get_treasury_data()
-        
-        # Get recent activities
-        recent_activities = get_recent_activities()
+        # Serve from the snapshot, loading only the slices it lacks
+        data = load_snapshot() or {}
+        loaders = {
+            'status': get_system_status,
+            'agents': get_active_agents,
+            'treasury': get_treasury_data,
+            'activities': get_recent_activities
+        }
+        missing = [name for name in loaders if name not in data]
+        if missing:
+            data.update(zip(missing, load_cached(*(loaders[name] for name in missing))))
+        system_status = data['status']
+        agents = data['agents']
+        treasury_data = data['treasury']
+        recent_activities = data['activities']
         
         return render_template('dashboard.html',
                              system_status=system_status,
@@ -77,8 +576,11 @@ def dashboard():
 def api_system_status():
     """API endpoint for system status"""
     try:
-        status = get_system_status()
-        return jsonify(status)
+        status = load_snapshot_slice('status', get_system_status)
+        response = etag_response(status)
+        # Status is refreshed every few seconds, so let browsers and proxies reuse it briefly
+        response.headers['Cache-Control'] = 'public, max-age=5'
+        return response
     except Exception as e:
         logger.error(f"System status API error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -87,8 +589,8 @@ def api_system_status():
 def api_agents():
     """API endpoint for agent information"""
     try:
-        agents = get_active_agents()
-        return jsonify(agents)
+        agents = load_snapshot_slice('agents', get_active_agents)
+        return etag_response(agents)
     except Exception as e:
         logger.error(f"Agents API error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -97,15 +599,26 @@ def api_agents():
 def api_create_agent():
     """API endpoint to create new agent"""
     try:
-        agent_config = request.get_json()
+        try:
+            agent_config = orjson.loads(request.data)
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Request body must be valid JSON'}), 400
+        
+        # Validate required fields and their types
+        try:
+            validate_agent_config(agent_config)
+        except fastjsonschema.JsonSchemaException as e:
+            return jsonify({'error': e.message}), 400
         
-        # Validate required fields
-        required_fields = ['name', 'type', 'config']
-        for field in required_fields:
-            if field not in agent_config:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+        # Hand creation off to the agent workers
+        try:
+            job = agent_queue.enqueue(create_agent, agent_config)
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Agent queue unavailable, creating inline: {e}")
+        else:
+            return (jsonify({'agent_id': job.id, 'status': 'pending'}), 202,
+                    {'Location': url_for('api_agent_status', job_id=job.id)})
         
-        # Create agent
         result = create_agent(agent_config)
         
         if result['success']:
@@ -117,12 +630,38 @@ def api_create_agent():
         logger.error(f"Create agent API error: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/agents/<job_id>')
+def api_agent_status(job_id):
+    """API endpoint for the status of a queued agent creation"""
+    try:
+        job = Job.fetch(job_id, connection=cache_client)
+    except NoSuchJobError:
+        job = None
+    except Exception as e:
+        logger.error(f"Agent status API error: {e}")
+        return jsonify({'error': str(e)}), 500
+    
+    # Only expose jobs from the agent queue, not anything else RQ holds in Redis
+    if job is None or job.origin != agent_queue.name:
+        return jsonify({'error': f'Unknown agent job: {job_id}'}), 404
+    
+    status = job.get_status()
+    response = {
+        'agent_id': job.id,
+        'status': status,
+        'result': job.return_value()
+    }
+    if status == JobStatus.FAILED:
+        # The worker traceback stays server-side
+        response['error'] = 'Agent creation failed'
+    return jsonify(response)
+
 @app.route('/api/treasury')
 def api_treasury():
     """API endpoint for treasury data"""
     try:
-        treasury_data = get_treasury_data()
-        return jsonify(treasury_data)
+        treasury_data = load_snapshot_slice('treasury', get_treasury_data)
+        return etag_response(treasury_data)
     except Exception as e:
         logger.error(f"Treasury API error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -132,7 +671,7 @@ def api_workflows():
     """API endpoint for workflow information"""
     try:
         workflows = get_workflows()
-        return jsonify(workflows)
+        return etag_response(workflows)
     except Exception as e:
         logger.error(f"Workflows API error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -145,181 +684,319 @@ def api_logs():
         level = request.args.get('level', 'INFO')
         
         logs = get_system_logs(limit=limit, level=level)
-        return jsonify(logs)
+        return etag_response(logs)
     except Exception as e:
         logger.error(f"Logs API error: {e}")
         return jsonify({'error': str(e)}), 500
 
+def tcp_reachable(url: str, timeout: float = TCP_PROBE_TIMEOUT) -> bool:
+    """Check that a TCP connection can be opened to the host of a URL"""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    try:
+        with socket.create_connection((parts.hostname, port), timeout=timeout):
+            return True
+    except (OSError, ValueError):
+        return False
+
+def redis_connected() -> bool:
+    """Report Redis connectivity, pinging at most every REDIS_HEALTH_INTERVAL seconds"""
+    now = time.monotonic()
+    checked_at = _redis_health['checked_at']
+    if checked_at is None or now - checked_at >= REDIS_HEALTH_INTERVAL:
+        try:
+            _redis_health['connected'] = bool(redis_client.ping())
+        except redis.exceptions.RedisError:
+            _redis_health['connected'] = False
+        _redis_health['checked_at'] = now
+    return _redis_health['connected']
+
+def _render_rows(skeleton, timestamp_field: str) -> List[Dict[str, Any]]:
+    """Copy mock rows, setting timestamp_field to now minus each row's offset"""
+    now = datetime.utcnow()
+    return [{**row, timestamp_field: now - offset} for offset, row in skeleton]
+
+# Upstream statuses are 'healthy' (health endpoint answered 200), 'unhealthy'
+# (it answered anything else) or 'unreachable' (no answer, or breaker open).
+# The background refresher runs the HTTP checks directly; request-path probes
+# first try a fast TCP connect so a down host fails without waiting on HTTP.
+
+def _http_health(url: str) -> str:
+    """Check a health endpoint over the pooled HTTP session"""
+    response = HTTP.get(url, timeout=UPSTREAM_TIMEOUT)
+    return 'healthy' if response.status_code == 200 else 'unhealthy'
+
+@agent_breaker
+def probe_agent_api() -> str:
+    """Check agent API health, failing fast when it refuses connections"""
+    if not tcp_reachable(CONFIG['AGENT_API_URL']):
+        raise UpstreamError('Agent API is unreachable')
+    return _http_health(f"{CONFIG['AGENT_API_URL']}/health")
+
+@mesh_breaker
+def probe_mesh_network() -> str:
+    """Check mesh network health, failing fast when it refuses connections"""
+    if not tcp_reachable(CONFIG['MESH_API_URL']):
+        raise UpstreamError('Mesh network is unreachable')
+    return _http_health(f"{CONFIG['MESH_API_URL']}/status")
+
+@agent_breaker
+def check_agent_api_health() -> str:
+    """Check agent API health over the pooled HTTP session"""
+    return _http_health(f"{CONFIG['AGENT_API_URL']}/health")
+
+@mesh_breaker
+def check_mesh_network_health() -> str:
+    """Check mesh network health over the pooled HTTP session"""
+    return _http_health(f"{CONFIG['MESH_API_URL']}/status")
+
+@rpc_breaker
+def probe_treasury() -> str:
+    """Check blockchain RPC health, failing fast when it refuses connections"""
+    if not tcp_reachable(CONFIG['BLOCKCHAIN_RPC_URL']):
+        raise UpstreamError('Blockchain RPC is unreachable')
+    rpc_call('eth_blockNumber', [])
+    return 'healthy'
+
+@rpc_breaker
+def check_treasury_health() -> str:
+    """Check blockchain RPC health by asking the node for its latest block"""
+    rpc_call('eth_blockNumber', [])
+    return 'healthy'
+
+@cached(ttl=5, key='cache:status')
 def get_system_status() -> Dict[str, Any]:
-    """Get current system status"""
+    """Get current system status, failing fast on unreachable upstreams"""
+    return _collect_status(probe_agent_api, probe_mesh_network, probe_treasury)
+
+def get_system_health() -> Dict[str, Any]:
+    """Get current system status from semantic HTTP health checks"""
+    return _collect_status(check_agent_api_health, check_mesh_network_health, check_treasury_health)
+
+def _collect_status(agent_probe, mesh_probe, treasury_probe) -> Dict[str, Any]:
+    """Run the upstream probes and assemble the system status"""
     status = {
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': datetime.utcnow(),
         'api_status': 'unknown',
         'agents_status': 'unknown',
         'treasury_status': 'unknown',
         'mesh_status': 'unknown',
-        'redis_status': 'connected' if redis_client else 'disconnected'
+        'redis_status': 'connected' if redis_connected() else 'disconnected'
     }
     
-    # Check API health
-    try:
-        response = requests.get(f"{CONFIG['AGENT_API_URL']}/health", timeout=5)
-        status['api_status'] = 'healthy' if response.status_code == 200 else 'unhealthy'
-    except:
-        status['api_status'] = 'unreachable'
-    
-    # Check mesh network
-    try:
-        response = requests.get(f"{CONFIG['MESH_API_URL']}/status", timeout=5)
-        status['mesh_status'] = 'healthy' if response.status_code == 200 else 'unhealthy'
-    except:
-        status['mesh_status'] = 'unreachable'
+    # Probe all upstreams concurrently so latency is the slowest probe, not the sum
+    probes = {
+        'api_status': EXECUTOR.submit(agent_probe),
+        'mesh_status': EXECUTOR.submit(mesh_probe),
+        'treasury_status': EXECUTOR.submit(treasury_probe)
+    }
+    concurrent.futures.wait(probes.values(), timeout=PROBE_WAIT_TIMEOUT)
     
-    # Check treasury (blockchain connection)
-    try:
-        # This would check blockchain connectivity
-        status['treasury_status'] = 'healthy'  # Placeholder
-    except:
-        status['treasury_status'] = 'unreachable'
+    # Failed, timed out and short-circuited (pybreaker.CircuitBreakerError) probes
+    # are all reported as unreachable
+    for field, future in probes.items():
+        if future.done() and future.exception() is None:
+            status[field] = future.result()
+        else:
+            future.cancel()
+            status[field] = 'unreachable'
     
     return status
 
+@cached(ttl=10, key='cache:agents', fallback=True)
 def get_active_agents() -> List[Dict[str, Any]]:
     """Get list of active agents"""
     # This would fetch from the agent orchestrator
     # For now, return mock data
-    return [
-        {
-            'id': 'governance-agent-001',
-            'name': 'Governance Agent',
-            'type': 'governance',
-            'status': 'active',
-            'last_activity': (datetime.utcnow() - timedelta(minutes=5)).isoformat(),
-            'tasks_completed': 42,
-            'success_rate': 0.95
-        },
-        {
-            'id': 'treasury-agent-001',
-            'name': 'Treasury Agent',
-            'type': 'treasury',
-            'status': 'active',
-            'last_activity': (datetime.utcnow() - timedelta(minutes=2)).isoformat(),
-            'tasks_completed': 28,
-            'success_rate': 0.98
-        },
-        {
-            'id': 'mining-coordinator-001',
-            'name': 'Mining Coordinator',
-            'type': 'mining',
-            'status': 'idle',
-            'last_activity': (datetime.utcnow() - timedelta(hours=1)).isoformat(),
-            'tasks_completed': 156,
-            'success_rate': 0.92
-        }
+    return _render_rows(_MOCK_AGENTS, 'last_activity')
+
+def rpc_call(method: str, params: List[Any]) -> Any:
+    """Make a single JSON-RPC call to the blockchain node"""
+    payload = {'jsonrpc': '2.0', 'id': 0, 'method': method, 'params': params}
+    try:
+        response = HTTP.post(CONFIG['BLOCKCHAIN_RPC_URL'], json=payload, timeout=UPSTREAM_TIMEOUT)
+        response.raise_for_status()
+        reply = response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise UpstreamError(f"RPC {method} failed: {e}")
+    
+    if 'error' in reply:
+        raise UpstreamError(f"RPC {method} failed: {reply['error']}")
+    return reply['result']
+
+@rpc_breaker
+def rpc_batch(calls: List[Dict[str, Any]]) -> List[Any]:
+    """Make several JSON-RPC calls in one HTTP round trip
+    
+    Each call is a dict with ``method`` and ``params``; results are returned
+    in call order. Items the node rejects within the batch, or all of them
+    if the node does not support batching, are retried one by one.
+    """
+    payload = [
+        {'jsonrpc': '2.0', 'id': i, 'method': call['method'], 'params': call['params']}
+        for i, call in enumerate(calls)
     ]
+    try:
+        response = HTTP.post(CONFIG['BLOCKCHAIN_RPC_URL'], json=payload, timeout=UPSTREAM_TIMEOUT)
+        response.raise_for_status()
+        replies = response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise UpstreamError(f"RPC batch failed: {e}")
+    
+    if not isinstance(replies, list):
+        replies = []
+    replies_by_id = {reply.get('id'): reply for reply in replies if isinstance(reply, dict)}
+    
+    results = []
+    for i, call in enumerate(calls):
+        reply = replies_by_id.get(i)
+        if reply is None or 'error' in reply:
+            results.append(rpc_call(call['method'], call['params']))
+        else:
+            results.append(reply['result'])
+    return results
 
+def _is_configured(address: str) -> bool:
+    """Check whether a contract address has been set"""
+    return bool(address) and address != '0x...'
+
+@cached(ttl=30, key='cache:treasury', fallback=True)
 def get_treasury_data() -> Dict[str, Any]:
     """Get treasury information"""
-    # This would fetch from blockchain
-    # For now, return mock data
+    treasury = CONFIG['TREASURY_CONTRACT']
+    if not _is_configured(treasury):
+        return _mock_treasury_data()
+    
+    # Fetch the ETH balance and every configured token balance in one batch
+    calls = [{'method': 'eth_getBalance', 'params': [treasury, 'latest']}]
+    tokens = []
+    for field, (contract_key, decimals) in TREASURY_TOKENS.items():
+        token = CONFIG[contract_key]
+        if not _is_configured(token):
+            continue
+        data = ERC20_BALANCE_OF + treasury[2:].lower().rjust(64, '0')
+        calls.append({'method': 'eth_call', 'params': [{'to': token, 'data': data}, 'latest']})
+        tokens.append((field, decimals))
+    
+    results = rpc_batch(calls)
+    
+    treasury_data = {
+        'total_value_locked': None,  # Requires a price feed
+        'eth_balance': int(results[0], 16) / 10 ** 18,
+        'xmrt_balance': None,
+        'usdc_balance': None,
+        'recent_transactions': _render_rows(_MOCK_TREASURY_TRANSACTIONS, 'timestamp')
+    }
+    for (field, decimals), result in zip(tokens, results[1:]):
+        treasury_data[field] = int(result, 16) / 10 ** decimals
+    
+    return treasury_data
+
+def _mock_treasury_data() -> Dict[str, Any]:
+    """Mock treasury data used until the treasury contract is configured"""
     return {
-        'total_value_locked': 1250000.50,
-        'xmrt_balance': 850000.25,
-        'eth_balance': 125.75,
-        'usdc_balance': 275000.00,
-        'recent_transactions': [
-            {
-                'hash': '0x1234...5678',
-                'type': 'reward_distribution',
-                'amount': 5000.00,
-                'timestamp': (datetime.utcnow() - timedelta(hours=2)).isoformat()
-            },
-            {
-                'hash': '0x9876...4321',
-                'type': 'fee_collection',
-                'amount': 125.50,
-                'timestamp': (datetime.utcnow() - timedelta(hours=6)).isoformat()
-            }
-        ]
+        **_MOCK_TREASURY_BALANCES,
+        'recent_transactions': _render_rows(_MOCK_TREASURY_TRANSACTIONS, 'timestamp')
     }
 
+@cached(ttl=10, key='cache:activities')
 def get_recent_activities() -> List[Dict[str, Any]]:
     """Get recent system activities"""
-    return [
-        {
-            'timestamp': (datetime.utcnow() - timedelta(minutes=5)).isoformat(),
-            'type': 'agent_action',
-            'description': 'Governance Agent processed proposal #42',
-            'status': 'success'
-        },
-        {
-            'timestamp': (datetime.utcnow() - timedelta(minutes=15)).isoformat(),
-            'type': 'treasury_action',
-            'description': 'Reward distribution completed',
-            'status': 'success'
-        },
-        {
-            'timestamp': (datetime.utcnow() - timedelta(hours=1)).isoformat(),
-            'type': 'system_event',
-            'description': 'New mining cluster formed',
-            'status': 'info'
-        }
-    ]
-
-def create_agent(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a new agent"""
-    try:
-        # This would call the agent orchestrator API
-        # For now, return mock response
-        agent_id = f"{config['type']}-agent-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
-        
-        return {
-            'success': True,
-            'agent_id': agent_id,
-            'message': f"Agent '{config['name']}' created successfully"
-        }
-    except Exception as e:
-        return {
-            'success': False,
-            'error': str(e)
-        }
+    return _render_rows(_MOCK_ACTIVITIES, 'timestamp')
 
+@cached(ttl=30, key='cache:workflows')
 def get_workflows() -> List[Dict[str, Any]]:
     """Get workflow information"""
-    return [
-        {
-            'id': 'proposal-processing',
-            'name': 'Proposal Processing Workflow',
-            'status': 'active',
-            'executions': 15,
-            'success_rate': 0.93,
-            'last_execution': (datetime.utcnow() - timedelta(hours=2)).isoformat()
-        },
-        {
-            'id': 'reward-distribution',
-            'name': 'Reward Distribution Workflow',
-            'status': 'scheduled',
-            'executions': 8,
-            'success_rate': 1.0,
-            'last_execution': (datetime.utcnow() - timedelta(days=1)).isoformat()
-        }
-    ]
+    return _render_rows(_MOCK_WORKFLOWS, 'last_execution')
 
 def get_system_logs(limit: int = 100, level: str = 'INFO') -> List[Dict[str, Any]]:
-    """Get system logs"""
-    # This would fetch from logging system
-    # For now, return mock data
-    logs = []
-    for i in range(min(limit, 20)):
-        logs.append({
-            'timestamp': (datetime.utcnow() - timedelta(minutes=i*5)).isoformat(),
-            'level': level,
-            'component': 'dashboard',
-            'message': f'Sample log message {i+1}',
-            'details': {}
-        })
+    """Get the most recent system logs for a level"""
+    if limit <= 0:
+        return []
+    
+    try:
+        entries = redis_client.lrange(f"logs:{level.upper()}", 0, min(limit, LOG_RETENTION) - 1)
+    except redis.exceptions.RedisError as e:
+        logger.warning(f"Log read failed: {e}")
+        return []
+    return [orjson.loads(entry) for entry in entries]
+
+def refresh_snapshot():
+    """Recompute the dashboard snapshot and store it in Redis"""
+    names = ('status', 'agents', 'treasury', 'activities')
+    # The refresher runs the full HTTP health checks the request path skips
+    try:
+        status_entry = (get_system_health(), 'MISS')
+    except Exception as e:
+        status_entry = (e, 'ERROR')
+    entries = [status_entry] + load_cached_with_status(
+        get_active_agents, get_treasury_data, get_recent_activities, return_exceptions=True
+    )
     
-    return logs
+    # Failed slices are left out so readers load just those themselves
+    snapshot = {'errors': [], 'stale': []}
+    values = {}
+    for name, (value, cache_status) in zip(names, entries):
+        if cache_status == 'ERROR':
+            logger.warning(f"Snapshot slice {name} failed: {value}")
+            snapshot['errors'].append(name)
+            continue
+        values[name] = value
+        # Lists cannot carry a stale flag themselves, so record stale slices by name
+        if cache_status == 'STALE':
+            snapshot['stale'].append(name)
+    snapshot.update(values)
+    snapshot['etags'] = {name: etag_for(_cache_dumps(value)) for name, value in values.items()}
+    # Expire abandoned snapshots so a dead refresher never serves data forever
+    cache_client.set(SNAPSHOT_KEY, _cache_dumps(snapshot), ex=SNAPSHOT_INTERVAL * 3)
+
+def _acquire_refresher_lock() -> bool:
+    """Take or extend the refresher lock, returning whether this process holds it"""
+    ttl_ms = SNAPSHOT_INTERVAL * 3000
+    if redis_client.set(SNAPSHOT_LOCK_KEY, REFRESHER_ID, nx=True, px=ttl_ms):
+        return True
+    if redis_client.get(SNAPSHOT_LOCK_KEY) == REFRESHER_ID:
+        redis_client.pexpire(SNAPSHOT_LOCK_KEY, ttl_ms)
+        return True
+    return False
+
+def refresh_loop():
+    """Refresh the dashboard snapshot every SNAPSHOT_INTERVAL seconds while leader"""
+    while True:
+        try:
+            if _acquire_refresher_lock():
+                refresh_snapshot()
+        except Exception as e:
+            logger.error(f"Snapshot refresh error: {e}")
+        time.sleep(SNAPSHOT_INTERVAL)
+
+def start_snapshot_refresher():
+    """Start the background snapshot refresher for this process"""
+    global _refresher_thread
+    if _refresher_thread is not None:
+        return
+    _refresher_thread = threading.Thread(target=refresh_loop, name='snapshot-refresher', daemon=True)
+    _refresher_thread.start()
+
+def load_snapshot() -> Any:
+    """Load the precomputed dashboard snapshot, or None if unavailable"""
+    try:
+        raw = cache_client.get(SNAPSHOT_KEY)
+    except redis.exceptions.RedisError as e:
+        logger.warning(f"Snapshot read failed: {e}")
+        return None
+    return None if raw is None else _cache_loads(raw)
+
+def load_snapshot_slice(name: str, loader) -> Any:
+    """Serve one part of the dashboard snapshot, falling back to its loader"""
+    snapshot = load_snapshot()
+    if snapshot is not None and name in snapshot:
+        if name in snapshot.get('stale', ()):
+            _set_cache_status('STALE')
+        else:
+            _set_cache_status('HIT', snapshot.get('etags', {}).get(name))
+        return snapshot[name]
+    return loader()
 
 @app.errorhandler(404)
 def not_found(error):
@@ -333,5 +1010,7 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV') == 'development'
     
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
     logger.info(f"Starting XMRT Dashboard on port {port}")
+    start_snapshot_refresher()
     app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+XMRT Dashboard - Background tasks
+Jobs executed by RQ workers (rq worker agents). Kept free of import-time
+side effects so workers can load it without bootstrapping the dashboard.
+"""
+
+from datetime import datetime
+from typing import Dict, Any
+
+def create_agent(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a new agent"""
+    try:
+        # This would call the agent orchestrator API
+        # For now, return mock response
+        agent_id = f"{config['type']}-agent-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+        
+        return {
+            'success': True,
+            'agent_id': agent_id,
+            'message': f"Agent '{config['name']}' created successfully"
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }